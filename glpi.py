@@ -1,9 +1,27 @@
 import requests
-import base64
+from requests.adapters import HTTPAdapter
 import json
 import os
 import getpass
 import logging
+import time
+import random
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# orjson encodes/decodes noticeably faster than the stdlib; fall back if it is missing
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+from concurrent.futures import Executor, Future
+import queue
 
 # --- Application Imports ---
 if __name__ == "__main__":
@@ -13,27 +31,184 @@ if __name__ == "__main__":
 log = logging.getLogger(__name__)
 
 
+class DaemonExecutor(Executor):
+    # Fixed-size pool like ThreadPoolExecutor, but its workers are daemon threads, so
+    # a request still running when the app closes does not keep the process alive
+    def __init__(self, max_workers, thread_name_prefix):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._jobs = queue.SimpleQueue()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._jobs.put((future, fn, args, kwargs))
+            if len(self._threads) < self._max_workers:
+                thread = threading.Thread(target=self._work, daemon=True,
+                                          name=f"{self._thread_name_prefix}_{len(self._threads)}")
+                thread.start()
+                self._threads.append(thread)
+        return future
+
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, fn, args, kwargs = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._lock:
+            self._shutdown = True
+            threads = list(self._threads)
+        if cancel_futures:
+            while True:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is not None:
+                    job[0].cancel()
+        for _ in threads:
+            self._jobs.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
 # --- Statics ---
 api_url = None
+# GLPI web root (api_url without /apirest.php), for building links into the web UI
+base_url = None
 app_token = None
 session_token = None
 username = None
 
-def init_glpi(app_token_param, api_url_param):
-    global app_token, api_url
+# getId() sentinels for "permission denied" and "no match"
+_MISSING_IDS = frozenset({1403, 1404})
+
+# Hardware component key -> (GLPI itemtype, link field, link endpoint)
+COMPONENT_SPEC = {
+    "cpu": ("DeviceProcessor", "deviceprocessors_id", "/Item_DeviceProcessor"),
+    "processor": ("DeviceProcessor", "deviceprocessors_id", "/Item_DeviceProcessor"),
+    "gpu": ("DeviceGraphicCard", "devicegraphiccards_id", "/Item_DeviceGraphicCard"),
+    "ram": ("DeviceMemory", "devicememories_id", "/Item_DeviceMemory"),
+    "hdd": ("DeviceHardDrive", "deviceharddrives_id", "/Item_DeviceHardDrive"),
+}
+
+# Shared HTTP session so every call reuses pooled keep-alive connections
+_session = None
+# Worker pool for independent lookups that would otherwise run back to back
+_executor = DaemonExecutor(max_workers=8, thread_name_prefix="glpi")
+
+# getId results keyed by (itemtype, normalized query) -> (id, expires_at), bounded LRU
+# Hits never expire, 1403/1404 misses are only remembered for _ID_MISS_TTL seconds
+_id_cache = OrderedDict()
+_ID_CACHE_SIZE = 4096
+_ID_MISS_TTL = 60
+_id_lock = threading.Lock()
+# Lookups currently being fetched, so concurrent identical getId calls share one request
+_id_pending = {}
+
+# Retry policy for transient failures (429/408/5xx, dropped connections)
+_MAX_RETRIES = 3
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+# Overall seconds a call may spend retrying (requests plus backoff) before giving up
+_RETRY_BUDGET = 15.0
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Retry counters for the session log; workers update them concurrently, so under a lock
+metrics = {"retries": 0, "rate_limited": 0}
+_metrics_lock = threading.Lock()
+
+# Future resolving the logged in user's ID (users_id_tech), started at login
+_tech_user_id = None
+
+# Per-session request headers, rebuilt only when the session token changes
+_session_headers = None
+
+# Conditional GET cache: (url, params, raw) -> (etag, result), bounded LRU
+_etag_cache = OrderedDict()
+_ETAG_CACHE_SIZE = 256
+_etag_lock = threading.Lock()
+
+# Successful search() results keyed by (mode, normalized query) -> (text, decoded, expires_at), bounded LRU
+# Dropped whenever a computer is added, since a new serial could now match
+_search_cache = OrderedDict()
+_SEARCH_CACHE_SIZE = 128
+_SEARCH_TTL = 60
+_search_lock = threading.Lock()
+# _search() marker for a body that could not be decoded
+_NOT_JSON = object()
+
+def init_glpi(app_token_param, api_url_param, verify_ssl=True):
+    global app_token, api_url, base_url
     if not app_token_param or "PLEASE_REPLACE" in app_token_param:
         raise ValueError("GLPI Library Error: App-Token is missing or invalid. Please set it in glpi_config.toml.")
     if not api_url_param:
         raise ValueError("GLPI Library Error: API-Endpoint is missing. Please set it in glpi_config.toml.")
     app_token = app_token_param
     api_url = api_url_param
+    base_url = api_url.rstrip("/").removesuffix("/apirest.php")
+
+    _reset_session(verify_ssl)
     log.info("GLPI library initialized with an App-Token and API-Endpoint.")
 
+def _reset_session(verify_ssl):
+    # Replace the shared Session with a fresh one, closing the old pooled connections
+    global _session
+    if _session is not None:
+        _session.close()
+    _session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0)
+    _session.mount("https://", adapter)
+    _session.mount("http://", adapter)
+    # TLS verification is a session setting, so every request shares one SSL context
+    _session.verify = verify_ssl
+    _session.headers.update({
+        'Content-Type': 'application/json',
+        'App-Token': f'{app_token}'
+    })
+
+def close():
+    # Release pooled connections for good, e.g. when the application exits
+    if _session is not None:
+        _session.close()
+
 # --- Basics that we should always have ---
 def killsession():
-    global session_token
-    if session_token:
-        sendglpi("/killSession", session_token)
+    global session_token, username, _session_headers, _tech_user_id
+    _tech_user_id = None
+    try:
+        if session_token:
+            # Runs on the Tk thread at logout/exit, so a single attempt like before
+            sendglpi("/killSession", session_token, retries=0)
+    finally:
+        # Forget the token even if the server could not be reached, and release pooled
+        # sockets by swapping in a fresh Session for the next login
+        session_token = None
+        username = None
+        _session_headers = None
+        clear_search_cache()
+        if _session is not None:
+            _reset_session(_session.verify)
+
+def _prefetch_tech_user():
+    global _tech_user_id
+    _tech_user_id = _executor.submit(getId, "User", username)
 
 def restore_session(session_token_param, username_param):
     global session_token, username
@@ -41,15 +216,12 @@ def restore_session(session_token_param, username_param):
         raise RuntimeError("GLPI Library Error: init_glpi() must be called before using the API.")
     
     try:
-        headers = {
-            'Content-Type': 'application/json',
-            'App-Token': f'{app_token}',
-            'Session-Token': f'{session_token_param}'
-        }
-        response = requests.get(f"{api_url}/getMyProfiles", headers=headers, timeout=5)
+        headers = {'Session-Token': f'{session_token_param}'}
+        response = _session.get(f"{api_url}/getMyProfiles", headers=headers, timeout=5)
         if response.status_code == 200:
             session_token = session_token_param
             username = username_param
+            _prefetch_tech_user()
             log.info(f"Session restored for user: {username}")
             return True
         else:
@@ -59,15 +231,15 @@ def restore_session(session_token_param, username_param):
         log.error(f"Failed to restore session: {e}")
         return False
 
+_YES = frozenset({'y', 'yes', 'j', 'ja'})
+_NO = frozenset({'n', 'no', 'nein'})
+
 def confirm(question):
-    valid_yes = ['y', 'yes', 'Y', 'Yes', 'YES', 'Ja', 'JA', 'ja', 'j']
-    valid_no = ['n', 'no', 'N', 'No', 'NO', 'Nein', 'nein', 'NEIN']
-    
     while True:
-        answer = input(f"{question} (y/n): ").strip()
-        if answer in valid_yes:
+        answer = input(f"{question} (y/n): ").strip().casefold()
+        if answer in _YES:
             return True
-        elif answer in valid_no:
+        elif answer in _NO:
             return False
         else:
             log.warning("Invalid Option. (y/n)")
@@ -76,8 +248,59 @@ def confirm(question):
 
 # --- GLPI Library ---
 
-def sendglpi(endpoint, session_token_param=None, method="GET", payload={}):
-    global session_token, username
+def _retry_delay(attempt, response=None):
+    # Full jitter: sleep anywhere between 0 and the capped exponential step
+    delay = random.uniform(0, min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** attempt))
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            wait = float(retry_after)
+        except ValueError:
+            try:
+                wait = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                wait = 0
+        delay = max(min(wait, _BACKOFF_CAP), delay)
+    return delay
+
+def _preview(response, n=512):
+    # Bounded view of a response body for logging, without decoding all of it
+    return response.content[:n].decode("utf-8", "replace")
+
+def _count(metric):
+    with _metrics_lock:
+        metrics[metric] += 1
+
+def _send(method, url, retries=_MAX_RETRIES, **kwargs):
+    # POSTs are only retried when the server provably did not process them
+    idempotent = method.upper() in _IDEMPOTENT_METHODS
+    attempt = 0
+    deadline = time.monotonic() + _RETRY_BUDGET
+    while True:
+        try:
+            response = _session.request(method, url, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            retryable = idempotent or isinstance(e, requests.exceptions.ConnectTimeout)
+            delay = _retry_delay(attempt)
+            if not retryable or attempt >= retries or time.monotonic() + delay > deadline:
+                raise
+            log.warning(f"{method} {url} failed ({e}), retrying in {delay:.1f}s")
+        else:
+            status = response.status_code
+            if status == 429:
+                _count("rate_limited")
+            retryable = status == 429 or (idempotent and (status == 408 or status >= 500))
+            delay = _retry_delay(attempt, response)
+            if not retryable or attempt >= retries or time.monotonic() + delay > deadline:
+                return response
+            log.warning(f"{method} {url} returned {status}, retrying in {delay:.1f}s")
+        _count("retries")
+        attempt += 1
+        time.sleep(delay)
+
+def sendglpi(endpoint, session_token_param=None, method="GET", payload=None, raw=False, params=None, retries=_MAX_RETRIES):
+    # Returns the decoded JSON body (None when empty), or the body text if raw=True
+    global session_token, username, _session_headers, _tech_user_id
     if not app_token:
         raise RuntimeError("GLPI Library Error: init_glpi() must be called before using the API.")
     
@@ -87,47 +310,148 @@ def sendglpi(endpoint, session_token_param=None, method="GET", payload={}):
     if not session_token_param:
         raise RuntimeError("GLPI Library Error: No session token available. Please authenticate first.")
     
-    log.debug(f'{method} request to {endpoint}, with session Token {session_token_param} and payload {payload}')
+    log.debug("%s request to %s, payload %.200r", method, endpoint, payload)
     if endpoint.startswith(api_url):
         url = f"{endpoint}"
     else:
         url = f"{api_url}{endpoint}"
-    headers = {
-        'Content-Type': 'application/json',
-        'App-Token': f'{app_token}',
-        'Session-Token': f'{session_token_param}'
-    }
-    response = requests.request(f"{method}", url, headers=headers, data=payload, timeout=5)
+    headers = _session_headers
+    if headers is None or headers['Session-Token'] != session_token_param:
+        headers = {'Session-Token': session_token_param}
+        if session_token_param == session_token:
+            _session_headers = headers
+
+    cache_key = (url, tuple(sorted(params.items())) if params else (), raw)
+    cached = None
+    if method == "GET":
+        with _etag_lock:
+            cached = _etag_cache.get(cache_key)
+            if cached is not None:
+                _etag_cache.move_to_end(cache_key)
+        if cached is not None:
+            headers = {**headers, 'If-None-Match': cached[0]}
+
+    body = _dumps(payload) if payload is not None else None
+    response = _send(method, url, retries, headers=headers, params=params, data=body, timeout=5)
     
+    if response.status_code == 304 and cached is not None:
+        log.debug("Not modified, using cached response for %s", url)
+        return cached[1]
+
     if response.status_code == 401:
         session_token = None
         username = None
+        _session_headers = None
+        _tech_user_id = None
+        _clear_caches()
         log.warning("Session token expired or invalid - cleared session")
     
     if response.status_code == 404:
         raise Exception("Site not found")
-    responset = response.text
-    log.debug(responset)
-    for letter in responset:
-        if letter == "#":
-            raise Exception
-    return responset
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(_preview(response))
+    if raw:
+        result = response.text
+    else:
+        result = _loads(response.content) if response.content else None
+
+    etag = response.headers.get("ETag")
+    if method == "GET" and etag and response.status_code == 200:
+        with _etag_lock:
+            _etag_cache[cache_key] = (etag, result)
+            _etag_cache.move_to_end(cache_key)
+            if len(_etag_cache) > _ETAG_CACHE_SIZE:
+                _etag_cache.popitem(last=False)
+    return result
+
+def _contains(field, query):
+    # Single "field contains query" search criterion as request params; requests
+    # URL-encodes them, so characters like '&', '#' or '+' cannot break the query
+    return {
+        "criteria[0][link]": "AND",
+        "criteria[0][field]": field,
+        "criteria[0][searchtype]": "contains",
+        "criteria[0][value]": query,
+    }
+
+# Fixed part of getId's search: only the ID column (2) of the first matching row
+_ID_SEARCH_PARAMS = {**_contains(1, None), "forcedisplay": 2, "range": "0-0"}
 
 def getId(itemtype, query):
     if not query:
         return None
+    # An int is already an ID; digit strings are not (e.g. model "7490", RAM "16")
+    if isinstance(query, int) and not isinstance(query, bool):
+        return query
+    key = (itemtype, str(query).strip().lower())
+    with _id_lock:
+        cached = _id_cache.get(key)
+        if cached is not None:
+            _id_cache.move_to_end(key)
+    if cached is not None:
+        item_id, expires_at = cached
+        if expires_at is None or time.monotonic() < expires_at:
+            return item_id
+
+    with _id_lock:
+        pending = _id_pending.get(key)
+        owner = pending is None
+        if owner:
+            pending = _id_pending[key] = Future()
+    if not owner:
+        return pending.result()
+
+    item_id = None
     try:
-        response = sendglpi(f"/search/{itemtype}?criteria[0][link]=AND&criteria[0][field]=1&criteria[0][searchtype]=contains&criteria[0][value]={query}&forcedisplay=2")
-        if response == '["ERROR_RIGHT_MISSING","Sie haben keine ausreichenden Rechte f\\xc3\\xbcr diese Aktion."]':
+        item_id = _fetch_id(itemtype, query)
+        with _id_lock:
+            if item_id in _MISSING_IDS:
+                _id_cache[key] = (item_id, time.monotonic() + _ID_MISS_TTL)
+            elif item_id is not None:
+                _id_cache[key] = (item_id, None)
+            if len(_id_cache) > _ID_CACHE_SIZE:
+                _id_cache.popitem(last=False)
+    finally:
+        with _id_lock:
+            del _id_pending[key]
+        pending.set_result(item_id)
+    return item_id
+
+def _ok(item_id):
+    return bool(item_id) and item_id not in _MISSING_IDS
+
+def clear_id_cache():
+    with _id_lock:
+        _id_cache.clear()
+
+def clear_search_cache():
+    with _search_lock:
+        _search_cache.clear()
+
+def _clear_caches():
+    # Cached IDs and responses depend on the rights of the session that fetched them
+    clear_id_cache()
+    clear_search_cache()
+    with _etag_lock:
+        _etag_cache.clear()
+
+def _fetch_id(itemtype, query):
+    try:
+        params = {**_ID_SEARCH_PARAMS, "criteria[0][value]": query}
+        response = sendglpi(f"/search/{itemtype}", params=params)
+        if isinstance(response, list) and response[:1] == ["ERROR_RIGHT_MISSING"]:
             log.error(f'1403: Permission denied reading {itemtype}')
             return 1403
-        response = json.loads(response)
-        try:
-            log.debug(f"Requested {itemtype} has ID {response['data'][0]['2']}")
-            return response['data'][0]['2']
-        except (KeyError, IndexError):
+        if not isinstance(response, dict):
+            # Error list or unexpected body (5xx, 400, 401, 429): not an answer, so not cached
+            log.error(f'Unexpected response getting ID for {itemtype} "{query}": {response!r:.200}')
+            return None
+        rows = response.get('data')
+        if response.get('totalcount') == 0 or not rows:
             log.warning(f'1404: No Result Matching {query} in {itemtype}')
             return 1404
+        log.debug("Requested %s has ID %s", itemtype, rows[0]['2'])
+        return rows[0]['2']
     except Exception as e:
         log.error(f'Error getting ID for {itemtype} "{query}": {e}')
         return None
@@ -135,20 +459,37 @@ def getId(itemtype, query):
 getID = getId
 getid = getId
 
+def getIdAsync(itemtype, query):
+    # getId on the shared lookup pool; returns a Future
+    return _executor.submit(getId, itemtype, query)
+
 def add(itemtype, data):
     if itemtype == "Computer": 
         log.debug('Reached add: Computer')
+
+        # The ID lookups are independent, so resolve them concurrently
+        lookups = {
+            "locations_id": ("Location", data.get("location")),
+            "computermodels_id": ("ComputerModel", data.get("model")),
+            "manufacturers_id": ("Manufacturer", data.get("manufacturer")),
+            "computertypes_id": ("ComputerType", data.get("computer_type")),
+        }
+        futures = {field: _executor.submit(getId, lookup_type, value) for field, (lookup_type, value) in lookups.items()}
+        # The technician is the logged in user, normally already resolved at login
+        tech_user = _tech_user_id
+        if tech_user is None or tech_user.result() is None:
+            tech_user = _executor.submit(getId, "User", username)
         
         payload_input = {
             "name": data.get("name"),
             "serial": data.get("serial"),
-            "locations_id": getId("Location", data.get("location")),
-            "users_id_tech": getId("User", username),
+            "locations_id": futures["locations_id"].result(),
+            "users_id_tech": tech_user.result(),
             "groups_id_tech": 1,
-            "computermodels_id": getId("ComputerModel", data.get("model")),
+            "computermodels_id": futures["computermodels_id"].result(),
             "comment" : data.get("comment"),
-            "manufacturers_id": getId("Manufacturer", data.get("manufacturer")),
-            "computertypes_id": getId("ComputerType", data.get("computer_type")),
+            "manufacturers_id": futures["manufacturers_id"].result(),
+            "computertypes_id": futures["computertypes_id"].result(),
             "_plugin_fields_funktionsfhigkeitfielddropdowns_id_defined": [7],
         }
 
@@ -162,80 +503,114 @@ def add(itemtype, data):
                 log.warning(f"Could not convert battery health '{battery_health_str}' to an integer. Skipping field.")
 
         payload = {"input": payload_input}
+        log.debug("Payload: %.200r", payload)
         
-        log.debug(f"Payload Pre-Conversion: {payload}")
-        payload_json = json.dumps(payload)
-        log.debug(f"Payload Post-Conversion: {payload_json}")
+        response_data = sendglpi(f"/{itemtype}/", None, "POST", payload)
+        log.debug("Response %.200r", response_data)
         
-        response = sendglpi(f"/{itemtype}/", None, "POST", payload_json)
-        log.debug(f"Response {response}")
-        
-        response_data = json.loads(response)
-        computer_id = response_data.get("id")
+        computer_id = response_data.get("id") if isinstance(response_data, dict) else None
         
         if not computer_id:
-            log.error(f"Failed to create computer. Response: {response}")
-            raise Exception(f"Computer creation failed: {response_data.get('message', 'Unknown error')}")
+            log.error(f"Failed to create computer. Response: {response_data}")
+            message = response_data.get('message', 'Unknown error') if isinstance(response_data, dict) else response_data
+            raise Exception(f"Computer creation failed: {message}")
+        clear_search_cache()
 
-        items_to_add = ["cpu", "processor", "gpu", "ram", "hdd", "os"]
-        if any(item in data for item in items_to_add):
+        if "os" in data or any(item in data for item in COMPONENT_SPEC):
             addToItemtype(computer_id, data)
         
         return computer_id
 
 def addToItemtype(device_id, data):
+    # Phase 1: resolve every component and OS ID up front, concurrently
+    components = [c for c in COMPONENT_SPEC if data.get(c)]
+    component_ids = {c: _executor.submit(getId, COMPONENT_SPEC[c][0], data.get(c)) for c in components}
+
+    if data.get("os"):
+        os_lookups = {
+            "os": _executor.submit(getId, "OperatingSystem", data.get("os")),
+            "os_version": _executor.submit(getId, "OperatingSystemVersion", data.get("os_version")),
+            "os_edition": _executor.submit(getId, "OperatingSystemEdition", data.get("os_edition")),
+        }
+
+    # Phase 2: group the link items per endpoint and POST each group concurrently
+    per_endpoint = {}
+
     # 1. Handle Hardware Components
-    hardware_components = ["cpu", "processor", "gpu", "ram", "hdd"]
-    for component in hardware_components:
-        if component in data and data.get(component):
-            log.debug(f"Adding hardware component '{component}' to device ID {device_id}")
-            item_payload = {'items_id': device_id, 'itemtype': 'Computer'}
-            
-            if component in ("processor", "cpu"):
-                item_payload['deviceprocessors_id'] = getId("DeviceProcessor", data.get(component))
-                endpoint = "/Item_DeviceProcessor"
-            elif component == "gpu":
-                item_payload['devicegraphiccards_id'] = getId("DeviceGraphicCard", data.get(component))
-                endpoint = "/Item_DeviceGraphicCard"
-            elif component == "ram":
-                item_payload['devicememories_id'] = getId("DeviceMemory", data.get(component))
-                endpoint = "/Item_DeviceMemory"
-            elif component == "hdd":
-                item_payload['deviceharddrives_id'] = getId("DeviceHardDrive", data.get(component))
-                endpoint = "/Item_DeviceHardDrive"
-            else:
-                continue
-            
-            payload = json.dumps({'input': item_payload})
-            sendglpi(endpoint, None, method="POST", payload=payload)
+    for component in components:
+        log.debug("Adding hardware component '%s' to device ID %s", component, device_id)
+        _, field, endpoint = COMPONENT_SPEC[component]
+        item_payload = {'items_id': device_id, 'itemtype': 'Computer', field: component_ids[component].result()}
+        per_endpoint.setdefault(endpoint, []).append(item_payload)
 
     # 2. Handle Operating System Link
     if data.get("os"):
-        log.debug(f"Linking Operating System to device ID {device_id}")
-        os_id = getId("OperatingSystem", data.get("os"))
-        os_version_id = getId("OperatingSystemVersion", data.get("os_version"))
-        os_edition_id = getId("OperatingSystemEdition", data.get("os_edition"))  # Added this line
+        log.debug("Linking Operating System to device ID %s", device_id)
+        os_id = os_lookups["os"].result()
+        os_version_id = os_lookups["os_version"].result()
+        os_edition_id = os_lookups["os_edition"].result()
 
-        if os_id and os_id not in [1403, 1404]:
+        if _ok(os_id):
             os_payload_input = {
                 'items_id': device_id,
                 'itemtype': 'Computer',
                 'operatingsystems_id': os_id,
             }
-            if os_version_id and os_version_id not in [1403, 1404]:
+            if _ok(os_version_id):
                 os_payload_input['operatingsystemversions_id'] = os_version_id
-            if os_edition_id and os_edition_id not in [1403, 1404]:  # Added this block
+            if _ok(os_edition_id):
                 os_payload_input['operatingsystemeditions_id'] = os_edition_id
             
-            payload = json.dumps({'input': os_payload_input})
-            sendglpi("/Item_OperatingSystem", None, method="POST", payload=payload)
+            per_endpoint.setdefault("/Item_OperatingSystem", []).append(os_payload_input)
         else:
             log.warning(f"Could not link Operating System because its ID could not be found for: {data.get('os')}")
 
+    # GLPI accepts a list as "input", creating every item in one request
+    links = []
+    for endpoint, items in per_endpoint.items():
+        payload = {'input': items if len(items) > 1 else items[0]}
+        links.append(_executor.submit(sendglpi, endpoint, None, "POST", payload))
+
+    # Surface the first failed link just like the sequential version did
+    for link in links:
+        link.result()
 
 def search(mode, query):
+    # Returns the response body as text
+    return _search(mode, query)[0]
+
+def search_json(mode, query):
+    # Same search, but returns the decoded JSON body; the body text if it is not JSON
+    text, result = _search(mode, query)
+    return text if result is _NOT_JSON else result
+
+def _search(mode, query):
+    # Returns (body text, decoded body or _NOT_JSON)
+    key = (mode, str(query).strip().lower())
+    with _search_lock:
+        cached = _search_cache.get(key)
+        if cached is not None:
+            _search_cache.move_to_end(key)
+    if cached is not None and time.monotonic() < cached[2]:
+        return cached[0], cached[1]
+
     if mode == "serial":
-        return(sendglpi(f"/search/Computer/?criteria[0][link]=AND&criteria[0][field]=5&criteria[0][searchtype]=contains&criteria[0][value]={query}"))
+        text = sendglpi("/search/Computer/", raw=True, params=_contains(5, query))
+    else:
+        return None, None
+    try:
+        result = _loads(text)
+    except ValueError:
+        return text, _NOT_JSON
+
+    # Only keep real result sets, never error pages or GLPI error lists
+    if isinstance(result, dict) and "totalcount" in result:
+        with _search_lock:
+            _search_cache[key] = (text, result, time.monotonic() + _SEARCH_TTL)
+            _search_cache.move_to_end(key)
+            if len(_search_cache) > _SEARCH_CACHE_SIZE:
+                _search_cache.popitem(last=False)
+    return text, result
     
 
 def auth(username_param, password, verify, remember):
@@ -244,40 +619,35 @@ def auth(username_param, password, verify, remember):
         raise RuntimeError("GLPI Library Error: init_glpi() must be called before using the API.")
     
     log.debug('Reached Auth')
-    log.debug(f"{username_param}, Verify: {verify}, RememberMe: {remember}")
+    log.debug("%s, Verify: %s, RememberMe: %s", username_param, verify, remember)
     
-    # Manually encode credentials to UTF-8 for Basic Auth
-    credentials = f"{username_param}:{password}"
-    encoded_credentials = base64.b64encode(credentials.encode('utf-8')).decode('utf-8')
+    # Pass the credentials as UTF-8 bytes so requests does not fall back to latin-1
+    credentials = (username_param.encode('utf-8'), password.encode('utf-8'))
     
-    payload = {}
-    headers = {
-        'Content-Type': 'application/json',
-        'App-Token': f'{app_token}',
-        'Authorization': f'Basic {encoded_credentials}'
-    }
+    _session.verify = verify
+    response = _session.get(f"{api_url}/initSession", auth=credentials, timeout=5)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(_preview(response))
     
-    response = requests.request("GET", f"{api_url}/initSession", headers=headers, data=payload, timeout=5, verify=verify)
-    log.debug(response.text)
-    response_text = str(response.content, 'utf-8')
+    try:
+        response_json = _loads(response.content)
+    except ValueError:
+        log.error(f"Unexpected auth response: {_preview(response)}")
+        return 1400
     
-    if 'ERROR_GLPI_LOGIN' in response_text:
+    if isinstance(response_json, list) and response_json[:1] == ["ERROR_GLPI_LOGIN"]:
         log.error("1401: Bad Username or Password")
         return 1401
         
-    log.debug(response_text)
-    if response_text.startswith('{'):
-        response_json = json.loads(response_text)
-        if 'session_token' in response_json: 
-            log.info('Authentication to GLPI Successful')
-            session_token = response_json['session_token']
-            username = username_param
-            return [response_json['session_token'], remember]
-        else:
-            log.error('1400: Something went wrong. Check Debug Logs')
-            return 1400
+    if isinstance(response_json, dict) and 'session_token' in response_json: 
+        log.info('Authentication to GLPI Successful')
+        session_token = response_json['session_token']
+        username = username_param
+        _clear_caches()
+        _prefetch_tech_user()
+        return [response_json['session_token'], remember]
     else:
-        log.error(f"Unexpected auth response: {response_text}")
+        log.error('1400: Something went wrong. Check Debug Logs')
         return 1400
 
 # --- Application --- (This part remains for standalone testing)
@@ -3,48 +3,81 @@ from tkinter import ttk, messagebox, scrolledtext, simpledialog, filedialog
 import toml
 import os
 import logging
+import logging.handlers
+import queue
 import atexit
 from pathlib import Path
 from datetime import datetime, timedelta
 import threading
+from concurrent.futures import as_completed
 import json
 import sys
 import webbrowser
 import csv
+import tempfile
+import socket
 # Version Management
 APP_VERSION = "0.9.1"
 
-# Add PIL import for image handling
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-    logging.warning("PIL/Pillow not found. Eye icons will use fallback text.")
+# Resolved once; the hostname does not change while the client is running
+HOSTNAME = socket.gethostname() or 'UNBEKANNTES GERÄT'
+
+# glpi.getId results meaning the item does not exist (or cannot be read)
+_NOT_FOUND_RESULTS = frozenset({None, 1403, 1404})
+
+# Purple theme palette, shared by ThemeManager, the dialogs and the hand-drawn widgets
+THEME = {
+    "BG": "#201a2b",
+    "FG": "#dcd4e8",
+    "WIDGET_BG": "#302a40",
+    "PRIMARY": "#8a2be2",
+    "ACCENT": "#9966cc",
+    "BORDER": "#4a445c",
+    "DARK_BORDER": "#1a1525",
+    "WIDGET_BORDER": "#403750",
+}
+
+# Pillow (eye icons) and sv-ttk (fluent theme) are optional and only imported on first use
+Image = ImageTk = None
+sv_ttk = None
+_optional_missing = set()
+
+def _load_pil():
+    """Import Pillow into Image/ImageTk on first use; False if it is not installed"""
+    global Image, ImageTk
+    if Image is None and "PIL" not in _optional_missing:
+        try:
+            from PIL import Image, ImageTk
+        except ImportError:
+            _optional_missing.add("PIL")
+            logging.warning("PIL/Pillow not found. Eye icons will use fallback text.")
+    return Image is not None
+
+def _load_sv_ttk():
+    """Import sv_ttk on first use; False if it is not installed"""
+    global sv_ttk
+    if sv_ttk is None and "sv_ttk" not in _optional_missing:
+        try:
+            import sv_ttk
+        except ImportError:
+            _optional_missing.add("sv_ttk")
+            logging.warning("sv-ttk library not found. 'fluent' theme will not be available.")
+    return sv_ttk is not None
+
+# PyInstaller unpacks bundled resources to sys._MEIPASS; resolved once at import
+_RESOURCE_BASE = getattr(sys, '_MEIPASS', None) or os.path.dirname(os.path.abspath(__file__))
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_RESOURCE_BASE, relative_path)
 
 # Import your existing GLPI library by its actual filename
 import glpi
 
-# Import system info gatherer
-from system_info import SystemInfoGatherer
-
-# Import the theme library if it exists
-try:
-    import sv_ttk
-    SV_TTK_AVAILABLE = True
-except ImportError:
-    SV_TTK_AVAILABLE = False
-    logging.warning("sv-ttk library not found. 'fluent' theme will not be available.")
-
 class ConfigManager:
+    # Session changes are written after this many seconds, coalescing bursts of updates
+    SAVE_DELAY = 0.5
+
     def __init__(self, config_path=None):
         if config_path is None:
             # Always use the directory where the executable is located, not the bundle directory
@@ -57,13 +90,20 @@ class ConfigManager:
             config_path = os.path.join(exe_dir, "glpi_config.toml")
         
         self.config_path = Path(config_path)
+        self._save_timer = None
+        self._save_lock = threading.Lock()
+        self._session_expiry = None
+        self._dir_ensured = False
         self.config = self.load_config()
+        atexit.register(self.flush)
 
     def load_config(self):
         default_config = self._get_default_config()
+        original = None
         if self.config_path.exists():
             try:
-                user_config = toml.load(self.config_path)
+                original = self.config_path.read_text()
+                user_config = toml.loads(original)
                 self._update_dict(default_config, user_config)
                 logging.info(f"Loaded config from: {self.config_path}")
             except Exception as e:
@@ -71,7 +111,9 @@ class ConfigManager:
         else:
             logging.info(f"Config file not found, creating new one at: {self.config_path}")
         
-        self.save_config(default_config)
+        # Only rewrite the file when it is missing or lacks keys from the defaults
+        if toml.dumps(default_config) != original:
+            self.save_config(default_config)
         return default_config
 
     def _get_default_config(self):
@@ -109,38 +151,80 @@ class ConfigManager:
     def save_config(self, config=None):
         if config is None: 
             config = self.config
+        tmp_path = None
         try:
-            # Ensure the directory exists
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, "w") as f: 
+            # Ensure the directory exists (checked once per ConfigManager)
+            if not self._dir_ensured:
+                self.config_path.parent.mkdir(parents=True, exist_ok=True)
+                self._dir_ensured = True
+            # Write to a temp file in the same directory and swap it in, so a crash never leaves a half-written config
+            fd, tmp_path = tempfile.mkstemp(dir=self.config_path.parent, prefix=".glpi_config.", suffix=".tmp")
+            with os.fdopen(fd, "w", buffering=1 << 16) as f:
                 toml.dump(config, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
+            tmp_path = None
             logging.debug(f"Config saved to: {self.config_path}")
         except Exception as e: 
             logging.error(f"Error saving config to {self.config_path}: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
 
     def _update_dict(self, base, update):
-        for k, v in update.items():
-            if isinstance(v, dict) and k in base and isinstance(base[k], dict):
-                self._update_dict(base[k], v)
-            else: 
-                base[k] = v
+        stack = [(base, update)]
+        while stack:
+            base, update = stack.pop()
+            for k, v in update.items():
+                if isinstance(v, dict) and isinstance(base.get(k), dict):
+                    stack.append((base[k], v))
+                elif k not in base or base[k] != v:
+                    base[k] = v
 
     def update_session(self, token, username):
         expires = datetime.now() + timedelta(hours=self.config["authentication"]["session_timeout_hours"])
         self.config["session"] = {"token": token, "expires": expires.isoformat(), "username": username}
-        self.save_config()
+        self.schedule_save()
 
     def clear_session(self):
         self.config["session"] = {"token": "", "expires": "", "username": ""}
+        self.schedule_save()
+
+    def schedule_save(self):
+        """Save the config shortly, folding further changes into the same write"""
+        with self._save_lock:
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush(self):
+        """Write a pending scheduled save now; also runs at exit"""
+        with self._save_lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer is None:
+            return
+        timer.cancel()
         self.save_config()
 
     def is_session_valid(self):
-        if not self.config.get("session", {}).get("token"): 
-            return False
-        try:
-            return datetime.now() < datetime.fromisoformat(self.config["session"]["expires"])
-        except: 
+        session = self.config.get("session", {})
+        if not session.get("token"): 
             return False
+        expires = session.get("expires")
+        # Parse the expiry once per stored value; later checks are a plain comparison
+        if self._session_expiry is None or self._session_expiry[0] != expires:
+            try:
+                parsed = datetime.fromisoformat(expires)
+            except (TypeError, ValueError): 
+                parsed = None
+            self._session_expiry = (expires, parsed)
+        parsed = self._session_expiry[1]
+        return parsed is not None and datetime.now() < parsed
 
 class AboutDialog(tk.Toplevel):
     def __init__(self, parent, config_manager, *args, **kwargs):
@@ -151,10 +235,10 @@ class AboutDialog(tk.Toplevel):
         self.config_manager = config_manager
 
         # Theme colors (match your purple theme)
-        BG = "#201a2b"
-        FG = "#dcd4e8"
-        ACCENT = "#9966cc"
-        BTN_BG = "#302a40"
+        BG = THEME["BG"]
+        FG = THEME["FG"]
+        ACCENT = THEME["ACCENT"]
+        BTN_BG = THEME["WIDGET_BG"]
 
         self.configure(bg=BG)
 
@@ -235,7 +319,7 @@ class AboutDialog(tk.Toplevel):
             parent,
             text=text,
             font=("Segoe UI", 9, "underline"),
-            bg="#201a2b", fg="#9966cc",
+            bg=THEME["BG"], fg=THEME["ACCENT"],
             cursor="hand2"
         )
         link_label.pack(pady=2)
@@ -245,7 +329,7 @@ class AboutDialog(tk.Toplevel):
         def on_enter(e):
             link_label.config(fg="#b380d9")
         def on_leave(e):
-            link_label.config(fg="#9966cc")
+            link_label.config(fg=THEME["ACCENT"])
         
         link_label.bind("<Enter>", on_enter)
         link_label.bind("<Leave>", on_leave)
@@ -259,13 +343,25 @@ class AboutDialog(tk.Toplevel):
             messagebox.showerror("Error", f"Failed to open URL:\n{url}", parent=self)
 
 class ThemeManager:
-    @staticmethod
-    def apply(root, config):
-        theme_name = config.get("ui", {}).get("theme", "legacy").lower()
-        if theme_name == "fluent" and SV_TTK_AVAILABLE:
+    # (root, theme settings) of the last apply; re-applying identical settings is skipped
+    _applied = None
+
+    @classmethod
+    def apply(cls, root, config):
+        ui = config.get("ui", {})
+        theme_name = ui.get("theme", "legacy").lower()
+        key = (
+            theme_name,
+            ui.get("purple_theme_rounded", True),
+            tuple(sorted(config.get("fluent_theme_colors", {}).items())),
+        )
+        if cls._applied is not None and cls._applied[0] is root and cls._applied[1] == key:
+            return
+        if theme_name == "fluent" and _load_sv_ttk():
             ThemeManager.apply_fluent_theme(root, config)
         elif theme_name == "purple":
             ThemeManager.apply_purple_theme(root, config)
+        cls._applied = (root, key)
 
     @staticmethod
     def apply_fluent_theme(root, config):
@@ -286,13 +382,13 @@ class ThemeManager:
     @staticmethod
     def apply_purple_theme(root, config):
         style = ttk.Style()
-        BG = "#201a2b"
-        FG = "#dcd4e8"
-        WIDGET_BG = "#302a40"
-        PRIMARY = "#8a2be2"
-        ACCENT = "#9966cc"
-        DARK_BORDER = "#1a1525"
-        WIDGET_BORDER = "#403750"
+        BG = THEME["BG"]
+        FG = THEME["FG"]
+        WIDGET_BG = THEME["WIDGET_BG"]
+        PRIMARY = THEME["PRIMARY"]
+        ACCENT = THEME["ACCENT"]
+        DARK_BORDER = THEME["DARK_BORDER"]
+        WIDGET_BORDER = THEME["WIDGET_BORDER"]
         
         rounded = config.get("ui", {}).get("purple_theme_rounded", True)
 
@@ -500,23 +596,30 @@ class ThemeManager:
             arrowcolor=FG
         )
         
-        for widget_type in ["TCombobox", "TSpinbox", "TScale", "TProgressbar"]:
-            try:
-                style.configure(widget_type,
-                    background=WIDGET_BG,
-                    foreground=FG,
-                    bordercolor=WIDGET_BORDER,
-                    lightcolor=WIDGET_BORDER,
-                    darkcolor=WIDGET_BORDER,
-                    troughcolor=BG,
-                    selectbackground=ACCENT
-                )
-            except:
-                pass
+        # No screen uses these yet, so only style each one the first time a widget of it is shown
+        lazy_style = dict(
+            background=WIDGET_BG,
+            foreground=FG,
+            bordercolor=WIDGET_BORDER,
+            lightcolor=WIDGET_BORDER,
+            darkcolor=WIDGET_BORDER,
+            troughcolor=BG,
+            selectbackground=ACCENT
+        )
+        styled = set()
+
+        def style_on_map(event):
+            widget_type = event.widget.winfo_class()
+            if widget_type not in styled:
+                styled.add(widget_type)
+                style.configure(widget_type, **lazy_style)
+
+        for widget_type in ("TCombobox", "TSpinbox", "TScale", "TProgressbar"):
+            root.bind_class(widget_type, "<Map>", style_on_map, add="+")
 
 class CustomCheckbox(tk.Frame):
     def __init__(self, parent, text, variable, **kwargs):
-        super().__init__(parent, bg="#201a2b", **kwargs)
+        super().__init__(parent, bg=THEME["BG"], **kwargs)
         self.variable = variable
         self.text = text
         
@@ -524,7 +627,7 @@ class CustomCheckbox(tk.Frame):
             self, 
             width=16, 
             height=16, 
-            bg="#201a2b", 
+            bg=THEME["BG"], 
             highlightthickness=0,
             cursor="hand2"
         )
@@ -533,8 +636,8 @@ class CustomCheckbox(tk.Frame):
         self.label = tk.Label(
             self,
             text=text,
-            bg="#201a2b",
-            fg="#dcd4e8",
+            bg=THEME["BG"],
+            fg=THEME["FG"],
             font=("Segoe UI", 10),
             cursor="hand2"
         )
@@ -544,6 +647,17 @@ class CustomCheckbox(tk.Frame):
         self.label.bind("<Button-1>", self._toggle)
         self.bind("<Button-1>", self._toggle)
         
+        # Items are created once; redraws only recolor the box and show/hide the tick
+        self._box = self.checkbox.create_rectangle(
+            1, 1, 15, 15,
+            fill=THEME["WIDGET_BG"],
+            outline=THEME["BORDER"],
+            width=2
+        )
+        self._ticks = (
+            self.checkbox.create_line(4, 8, 7, 11, fill="#ffffff", width=2, capstyle=tk.ROUND, state=tk.HIDDEN),
+            self.checkbox.create_line(7, 11, 12, 4, fill="#ffffff", width=2, capstyle=tk.ROUND, state=tk.HIDDEN),
+        )
         self._draw_checkbox()
         
         self.variable.trace_add("write", lambda *args: self._draw_checkbox())
@@ -552,36 +666,17 @@ class CustomCheckbox(tk.Frame):
         self.variable.set(not self.variable.get())
     
     def _draw_checkbox(self):
-        self.checkbox.delete("all")
-        
-        bg_color = "#302a40"
-        border_color = "#8a2be2" if self.variable.get() else "#4a445c"
-        check_color = "#ffffff"
-        
-        self.checkbox.create_rectangle(
-            1, 1, 15, 15,
-            fill=bg_color,
-            outline=border_color,
-            width=2
-        )
-        
-        if self.variable.get():
-            self.checkbox.create_line(
-                4, 8, 7, 11,
-                fill=check_color,
-                width=2,
-                capstyle=tk.ROUND
-            )
-            self.checkbox.create_line(
-                7, 11, 12, 4,
-                fill=check_color,
-                width=2,
-                capstyle=tk.ROUND
-            )
+        checked = self.variable.get()
+        self.checkbox.itemconfigure(self._box, outline=THEME["PRIMARY"] if checked else THEME["BORDER"])
+        for tick in self._ticks:
+            self.checkbox.itemconfigure(tick, state=tk.NORMAL if checked else tk.HIDDEN)
 
 class CustomEyeButton(tk.Frame):
+    # Tinted icons per Tk root; PhotoImages belong to one interpreter and are shared by every button
+    _icon_cache = {}
+
     def __init__(self, parent, command, **kwargs):
-        super().__init__(parent, bg="#302a40", **kwargs)
+        super().__init__(parent, bg=THEME["WIDGET_BG"], **kwargs)
         self.command = command
         self.visible = False
         
@@ -589,13 +684,9 @@ class CustomEyeButton(tk.Frame):
         self.closed_icon = None
         self.has_icons = False
         
-        if PIL_AVAILABLE:
+        if _load_pil():
             try:
-                open_img = Image.open(resource_path("assets/eye_open.png")).resize((24, 24), Image.Resampling.LANCZOS)
-                closed_img = Image.open(resource_path("assets/eye_closed.png")).resize((24, 24), Image.Resampling.LANCZOS)
-                
-                self.open_icon = ImageTk.PhotoImage(self._tint_image(open_img, "#ffffff"))
-                self.closed_icon = ImageTk.PhotoImage(self._tint_image(closed_img, "#ffffff"))
+                self.open_icon, self.closed_icon = self._load_icons()
                 self.has_icons = True
             except Exception as e:
                 logging.warning(f"Could not load eye icons: {e}")
@@ -605,7 +696,7 @@ class CustomEyeButton(tk.Frame):
                 self,
                 image=self.open_icon,
                 borderwidth=0,
-                background="#302a40",
+                background=THEME["WIDGET_BG"],
                 cursor="hand2"
             )
             self.widget.bind("<Button-1>", lambda e: self._on_click())
@@ -616,14 +707,33 @@ class CustomEyeButton(tk.Frame):
                 self,
                 text="👁",
                 command=self._on_click,
-                borderwidth=0, relief="flat", background="#302a40",
-                activebackground="#9966cc", foreground="#ffffff",
+                borderwidth=0, relief="flat", background=THEME["WIDGET_BG"],
+                activebackground=THEME["ACCENT"], foreground="#ffffff",
                 activeforeground="#ffffff", font=("Segoe UI", 14),
                 highlightthickness=0, cursor="hand2"
             )
         
         self.widget.pack(padx=4, pady=4)
 
+    def _load_icons(self):
+        root = self._root()
+        icons = CustomEyeButton._icon_cache.get(root)
+        if icons is None:
+            icons = tuple(
+                ImageTk.PhotoImage(self._load_icon(name), master=root)
+                for name in ("eye_open", "eye_closed")
+            )
+            CustomEyeButton._icon_cache[root] = icons
+        return icons
+
+    def _load_icon(self, name):
+        # Prefer the 24x24 white copies from tools/bake_icons.py, tint the source otherwise
+        baked = resource_path(f"assets/{name}_white.png")
+        if os.path.exists(baked):
+            return Image.open(baked)
+        image = Image.open(resource_path(f"assets/{name}.png")).resize((24, 24), Image.Resampling.LANCZOS)
+        return self._tint_image(image, "#ffffff")
+
     def _tint_image(self, image, color):
         if image.mode != 'RGBA': 
             image = image.convert('RGBA')
@@ -641,11 +751,11 @@ class CustomEyeButton(tk.Frame):
 
     def _on_hover(self, event):
         if self.has_icons:
-            self.widget.config(background="#9966cc")
+            self.widget.config(background=THEME["ACCENT"])
 
     def _on_leave(self, event):
         if self.has_icons:
-            self.widget.config(background="#302a40")
+            self.widget.config(background=THEME["WIDGET_BG"])
 
     def set_visible(self, visible):
         self.visible = visible
@@ -706,6 +816,15 @@ class LoginFrame(ttk.Frame):
         self.username_entry.focus()
         self.load_saved_credentials()
 
+    def on_show(self):
+        """Reset the form when the login screen is shown again after a logout"""
+        self.password_var.set("")
+        self.status_label.config(text="")
+        if self.password_visible.get():
+            self._toggle_password_visibility()
+        self.load_saved_credentials()
+        self.username_entry.focus()
+
     def _toggle_password_visibility(self):
         if self.password_visible.get():
             self.password_entry.config(show="*")
@@ -741,20 +860,20 @@ class MissingComponentsDialog(tk.Toplevel):
         self.result = None
 
         # Theme colors (match your purple theme)
-        BG = "#201a2b"
-        FG = "#dcd4e8"
-        ACCENT = "#9966cc"
+        BG = THEME["BG"]
+        FG = THEME["FG"]
+        ACCENT = THEME["ACCENT"]
         DANGER = "#c0392b"
-        BTN_BG = "#302a40"
+        BTN_BG = THEME["WIDGET_BG"]
         BTN_FG = FG
 
         self.configure(bg=BG)
 
         # Build message
-        msg = "Leider wurden die folgenden Elemente nicht in der Datenbank gefunden:\n\n"
-        for label, value in missing_components.items():
-            msg += f"{label}: {value}\n"
-        msg += "\nKontaktiere einen Administrator um dieses Problem zu lösen."
+        parts = ["Leider wurden die folgenden Elemente nicht in der Datenbank gefunden:\n\n"]
+        parts.extend(f"{label}: {value}\n" for label, value in missing_components.items())
+        parts.append("\nKontaktiere einen Administrator um dieses Problem zu lösen.")
+        msg = "".join(parts)
 
         # Message area
         msg_frame = tk.Frame(self, bg=BG)
@@ -820,17 +939,58 @@ class MissingComponentsDialog(tk.Toplevel):
         self.destroy()
 
 class AddComputerFrame(ttk.Frame):
+    # System info is gathered on one reusable daemon worker with one reusable gatherer;
+    # a daemon thread, so closing the window never waits for a running probe
+    _sysinfo_jobs = None
+    _sysinfo_gatherer = None
+    # (dialog label, GLPI itemtype, form key) for every value checked before adding
+    COMPONENT_CHECKS = (
+        ("GPU", "DeviceGraphicCard", "gpu"),
+        ("Prozessor", "DeviceProcessor", "processor"),
+        ("Arbeitsspeicher", "DeviceMemory", "ram"),
+        ("Festplatte", "DeviceHardDrive", "hdd"),
+        ("Modell", "ComputerModel", "model"),
+        ("Hersteller", "Manufacturer", "manufacturer"),
+        ("Computertyp", "ComputerType", "computer_type"),
+    )
+
     def __init__(self, parent, controller):
         super().__init__(parent, padding=10)
         self.controller = controller
         self.username = controller.username
         self.last_added_computer_id = None
+        # Bumped per login and logout; results from requests of an older session are dropped
+        self._session = 0
         
         self.setup_ui()
         self.load_defaults()
         if self.controller.config_manager.config.get("ui", {}).get("auto_gather_system_info", True):
             self.gather_system_info()
     
+    def on_show(self):
+        """Start from a clean form for the user who just logged in"""
+        self._session += 1
+        self.username = self.controller.username
+        self.last_added_computer_id = None
+        self.clear_form()
+        if self.controller.config_manager.config.get("ui", {}).get("auto_gather_system_info", True):
+            self.gather_system_info()
+        else:
+            self._update_status("Ready", "green")
+
+    def on_hide(self):
+        """Drop the results of requests still running for the user who logged out"""
+        self._session += 1
+        self.config(cursor="")
+
+    def _post(self, session, callback, *args):
+        """Schedule a UI update from a worker thread, dropped if the session has changed since"""
+        self.after(0, self._if_current, session, callback, *args)
+
+    def _if_current(self, session, callback, *args):
+        if session == self._session:
+            callback(*args)
+
     def setup_ui(self):
         # Status message frame at the top
         self.status_frame = ttk.Frame(self)
@@ -894,6 +1054,7 @@ class AddComputerFrame(ttk.Frame):
         hardware_lf = ttk.LabelFrame(content_frame, text="Hardware")
         hardware_lf.grid(row=0, column=1, padx=(5, 0), pady=5, sticky="nsew")
         self.hardware_vars = self._create_fields(hardware_lf, hardware_fields)
+        self._all_vars = {**self.basic_vars, **self.hardware_vars}
         
         # --- Bottom Bar for Import/Export and Add/Clear ---
         bottom_bar = ttk.Frame(self)
@@ -948,18 +1109,33 @@ class AddComputerFrame(ttk.Frame):
     def gather_system_info(self):
         self._update_status("Starting system information gathering...", "orange", show_progress=True)
         self.config(cursor="wait")
-        threading.Thread(target=self._gather_system_info_thread, daemon=True).start()
+        cls = AddComputerFrame
+        if cls._sysinfo_jobs is None:
+            cls._sysinfo_jobs = queue.SimpleQueue()
+            threading.Thread(target=cls._sysinfo_worker, name="sysinfo", daemon=True).start()
+        cls._sysinfo_jobs.put(lambda session=self._session: self._gather_system_info_thread(session))
+
+    @staticmethod
+    def _sysinfo_worker():
+        while True:
+            AddComputerFrame._sysinfo_jobs.get()()
     
-    def _gather_system_info_thread(self):
+    def _gather_system_info_thread(self, session):
         try:
             def status_callback(message):
                 # Update status in main thread
-                self.after(0, self._update_status, message, "orange", True)
+                self._post(session, self._update_status, message, "orange", True)
             
-            info = SystemInfoGatherer(status_callback=status_callback).gather_all_info()
-            self.after(0, self._update_fields_with_system_info, info)
+            cls = AddComputerFrame
+            if cls._sysinfo_gatherer is None:
+                # Imported here so startup does not pay for the platform probing modules
+                from system_info import SystemInfoGatherer
+                cls._sysinfo_gatherer = SystemInfoGatherer()
+            cls._sysinfo_gatherer.status_callback = status_callback
+            info = cls._sysinfo_gatherer.gather_all_info()
+            self._post(session, self._update_fields_with_system_info, info)
         except Exception as e:
-            self.after(0, self._handle_gather_error, str(e))
+            self._post(session, self._handle_gather_error, str(e))
     
     def _update_fields_with_system_info(self, info):
         self._set_form_data(info)
@@ -974,15 +1150,15 @@ class AddComputerFrame(ttk.Frame):
     
     def _get_form_data(self):
         """Collects all data from the form fields into a dictionary."""
-        all_vars = {**self.basic_vars, **self.hardware_vars}
-        return {key: var.get().strip() for key, var in all_vars.items()}
+        return {key: var.get().strip() for key, var in self._all_vars.items()}
 
     def _set_form_data(self, data):
         """Populates the form fields from a dictionary."""
-        all_vars = {**self.basic_vars, **self.hardware_vars}
-        for key, var in all_vars.items():
-            if key in data and data[key] is not None:
-                var.set(data[key])
+        for key, var in self._all_vars.items():
+            value = data.get(key)
+            # Skip unchanged values so no Tcl round-trip or trace fires for them
+            if value is not None and var.get() != value:
+                var.set(value)
 
     def export_to_file(self):
         """Exports form data to a user-selected file (JSON or CSV)."""
@@ -1061,44 +1237,34 @@ class AddComputerFrame(ttk.Frame):
         data["tech_user"] = self.username
         
         # Add the German comment as required by the updated GLPI library
-        hostname = os.popen('hostname').read().strip() or 'UNBEKANNTES GERÄT'
         data["comment"] = (f"\r\nDieses Rechengerät wurde automagisch von dem GLPI Client Version {APP_VERSION} hinzugefügt."
-                        f"\r\nDer Verantwortliche Nutzer ist {self.username} durch den Computer {hostname}. #GLPICLIENT{APP_VERSION}")
+                        f"\r\nDer Verantwortliche Nutzer ist {self.username} durch den Computer {HOSTNAME}. #GLPICLIENT{APP_VERSION}")
 
         self._update_status("Validating hardware components...", "orange", show_progress=True)
 
-        component_checks = {
-            "GPU": ("DeviceGraphicCard", data.get("gpu")),
-            "Prozessor": ("DeviceProcessor", data.get("processor")),
-            "Arbeitsspeicher": ("DeviceMemory", data.get("ram")),
-            "Festplatte": ("DeviceHardDrive", data.get("hdd")),
-            "Modell": ("ComputerModel", data.get("model")),
-            "Hersteller": ("Manufacturer", data.get("manufacturer")),
-            "Computertyp": ("ComputerType", data.get("computer_type")),
-        }
+        component_checks = {label: (itemtype, data.get(key)) for label, itemtype, key in self.COMPONENT_CHECKS}
         
-        threading.Thread(target=self._validate_components_thread, args=(component_checks, data), daemon=True).start()
+        self.controller.executor.submit(self._validate_components_thread, self._session, component_checks, data)
     
-    def _validate_components_thread(self, component_checks, data):
+    def _validate_components_thread(self, session, component_checks, data):
         """Validate components in background thread"""
         try:
-            missing = {}
-            checked_count = 0
-            total_checks = len([v for v in component_checks.values() if v[1]])
+            checks = {label: check for label, check in component_checks.items() if check[1]}
+            total_checks = len(checks)
+            # Component lookups are independent, so they are validated in parallel on glpi's pool
+            futures = {label: glpi.getIdAsync(itemtype, value) for label, (itemtype, value) in checks.items()}
+            
+            labels = {future: label for label, future in futures.items()}
+            for checked_count, future in enumerate(as_completed(labels), 1):
+                self._post(session, self._update_status, f"Checked {labels[future]}... ({checked_count}/{total_checks})", "orange", True)
             
-            for label, (itemtype, value) in component_checks.items():
-                if value:
-                    checked_count += 1
-                    self.after(0, self._update_status, f"Checking {label}... ({checked_count}/{total_checks})", "orange", True)
-                    
-                    result = glpi.getId(itemtype, value)
-                    if result in (None, 1403, 1404):
-                        missing[label] = value
+            # Keep the dialog in form order rather than completion order
+            missing = {label: checks[label][1] for label, future in futures.items() if future.result() in _NOT_FOUND_RESULTS}
             
-            self.after(0, self._handle_validation_result, missing, data)
+            self._post(session, self._handle_validation_result, missing, data)
             
         except Exception as e:
-            self.after(0, self._handle_validation_error, str(e))
+            self._post(session, self._handle_validation_error, str(e))
 
     def _handle_validation_result(self, missing, data):
         """Handle validation results in main thread"""
@@ -1124,15 +1290,15 @@ class AddComputerFrame(ttk.Frame):
 
     def _actually_add_computer(self, data):
         self._update_status("Sending new computer data to GLPI...", "orange", show_progress=True)
-        threading.Thread(target=self._add_computer_thread, args=(data,), daemon=True).start()
+        self.controller.executor.submit(self._add_computer_thread, self._session, data)
 
-    def _add_computer_thread(self, data):
+    def _add_computer_thread(self, session, data):
         """Add computer in background thread"""
         try:
             computer_id = glpi.add("Computer", data)
-            self.after(0, self._handle_add_result, computer_id, data.get("name", "Unknown"))
+            self._post(session, self._handle_add_result, computer_id, data.get("name", "Unknown"))
         except Exception as e:
-            self.after(0, self._handle_add_error, str(e))
+            self._post(session, self._handle_add_error, str(e))
 
     def _handle_add_result(self, computer_id, computer_name):
         """Handle computer addition result in main thread"""
@@ -1167,8 +1333,7 @@ class AddComputerFrame(ttk.Frame):
             return
         
         try:
-            base_url = glpi.api_url.replace("/apirest.php", "")
-            computer_url = f"{base_url}/front/computer.form.php?id={self.last_added_computer_id}"
+            computer_url = f"{glpi.base_url}/front/computer.form.php?id={self.last_added_computer_id}"
             
             logging.info(f"Opening computer {self.last_added_computer_id} in browser: {computer_url}")
             
@@ -1190,11 +1355,37 @@ class AddComputerFrame(ttk.Frame):
         self._update_status("Form cleared", "gray")
 
 class SearchFrame(ttk.Frame):
+    # Searches fired within this window collapse into the last one
+    SEARCH_DEBOUNCE_MS = 150
+    # Characters inserted into the results box per idle callback
+    RESULT_CHUNK_SIZE = 64 * 1024
+
     def __init__(self, parent, controller):
         super().__init__(parent, padding=10)
         self.controller = controller
+        self._search_generation = 0
+        self._pending_search = None
         self.setup_ui()
 
+    def on_show(self):
+        """Forget the previous user's search"""
+        if self._pending_search is not None:
+            self.after_cancel(self._pending_search)
+            self._pending_search = None
+        self._search_generation += 1
+        self.query_var.set("")
+        self.results_text.config(state="normal", cursor="")
+        self.results_text.delete("1.0", tk.END)
+        self.results_text.config(state="disabled")
+        self._update_status("Ready to search", "green")
+
+    def on_hide(self):
+        """Drop any pending or running search of the user who logged out"""
+        if self._pending_search is not None:
+            self.after_cancel(self._pending_search)
+            self._pending_search = None
+        self._search_generation += 1
+
     def setup_ui(self):
         # Status message frame at the top
         self.status_frame = ttk.Frame(self)
@@ -1251,48 +1442,63 @@ class SearchFrame(ttk.Frame):
         self.results_text.delete("1.0", tk.END)
         self.update_idletasks()
 
-        threading.Thread(target=self._search_thread, args=(query,), daemon=True).start()
+        # A newer search supersedes any pending or running one
+        if self._pending_search is not None:
+            self.after_cancel(self._pending_search)
+        self._search_generation += 1
+        self._pending_search = self.after(self.SEARCH_DEBOUNCE_MS, self._start_search, query, self._search_generation)
+
+    def _start_search(self, query, generation):
+        self._pending_search = None
+        self.controller.executor.submit(self._search_thread, query, generation)
+
+    def _if_current(self, generation, callback, *args):
+        """Run a UI update only if no newer search has started since"""
+        if generation == self._search_generation:
+            callback(*args)
+
+    def _search_thread(self, query, generation):
+        def post(callback, *args):
+            self.after(0, self._if_current, generation, callback, *args)
 
-    def _search_thread(self, query):
         try:
             # Step 1: Validate session
-            self.after(0, self._update_status, "Validating session...", "orange", True)
+            post(self._update_status, "Validating session...", "orange", True)
             if not hasattr(glpi, 'session_token') or not glpi.session_token:
-                self.after(0, self._handle_search_error, "Session expired. Please logout and login again.")
+                post(self._handle_search_error, "Session expired. Please logout and login again.")
                 return
             
             # Step 2: Send request
-            self.after(0, self._update_status, "Sending search request to GLPI...", "orange", True)
-            result_str = glpi.search("serial", query)
+            post(self._update_status, "Sending search request to GLPI...", "orange", True)
+            result_json = glpi.search_json("serial", query)
+            if isinstance(result_json, str):
+                # Not JSON; show the body as the server sent it
+                post(self._handle_search_success, result_json, query, "unknown")
+                return
             
             # Step 3: Process response
-            self.after(0, self._update_status, "Received response, processing results...", "orange", True)
-            try:
-                result_json = json.loads(result_str)
-                formatted_result = json.dumps(result_json, indent=2)
-                
-                # Count results
-                result_count = 0
-                if isinstance(result_json, dict) and "totalcount" in result_json:
-                    result_count = result_json["totalcount"]
-                elif isinstance(result_json, list):
-                    result_count = len(result_json)
-                
-                self.after(0, self._handle_search_success, formatted_result, query, result_count)
-            except json.JSONDecodeError:
-                self.after(0, self._handle_search_success, result_str, query, "unknown")
+            post(self._update_status, "Received response, processing results...", "orange", True)
+            formatted_result = json.dumps(result_json, indent=2)
+            
+            # Count results
+            result_count = 0
+            if isinstance(result_json, dict) and "totalcount" in result_json:
+                result_count = result_json["totalcount"]
+            elif isinstance(result_json, list):
+                result_count = len(result_json)
+            
+            post(self._handle_search_success, formatted_result, query, result_count)
                 
         except Exception as e:
             error_msg = f"An error occurred:\n{str(e)}"
             if "401" in str(e) or "Unauthorized" in str(e):
                 error_msg = "Session expired. Please logout and login again."
-            self.after(0, self._handle_search_error, error_msg)
+            post(self._handle_search_error, error_msg)
 
     def _handle_search_success(self, result_text, query, result_count):
         """Handle successful search results"""
         self.results_text.delete("1.0", tk.END)
-        self.results_text.insert(tk.END, result_text)
-        self.results_text.config(state="disabled", cursor="")
+        self._insert_results(result_text, self._search_generation)
         
         if isinstance(result_count, int):
             if result_count == 0:
@@ -1304,6 +1510,19 @@ class SearchFrame(ttk.Frame):
         else:
             self._update_status(f"Search completed for '{query}'", "green")
 
+    def _insert_results(self, text, generation, start=0):
+        """Insert results a chunk at a time so large responses don't freeze the window"""
+        if generation != self._search_generation:
+            return
+        end = start + self.RESULT_CHUNK_SIZE
+        self.results_text.config(state="normal")
+        self.results_text.insert(tk.END, text[start:end])
+        self.results_text.config(state="disabled")
+        if end < len(text):
+            self.after_idle(self._insert_results, text, generation, end)
+        else:
+            self.results_text.config(cursor="")
+
     def _handle_search_error(self, error_msg):
         """Handle search errors"""
         self.results_text.delete("1.0", tk.END)
@@ -1321,6 +1540,7 @@ class MainFrame(ttk.Frame):
         self.controller = controller
 
         menubar = tk.Menu(self.controller)
+        self.menubar = menubar
         self.controller.config(menu=menubar)
         
         # File menu
@@ -1344,6 +1564,18 @@ class MainFrame(ttk.Frame):
 
         notebook.add(add_computer_tab, text="Add Computer")
         notebook.add(search_tab, text="Search")
+        self.tabs = (add_computer_tab, search_tab)
+
+    def on_show(self):
+        """Restore the menu and reset the tabs for the newly logged in user"""
+        self.controller.config(menu=self.menubar)
+        for tab in self.tabs:
+            tab.on_show()
+
+    def on_hide(self):
+        """Forget work still running for the user who is logging out"""
+        for tab in self.tabs:
+            tab.on_hide()
 
     def _show_about(self):
         """Show the about dialog."""
@@ -1363,12 +1595,23 @@ class MainFrame(ttk.Frame):
                 parent=self
             )
 
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records unformatted, leaving all formatting to the listener thread"""
+    def prepare(self, record):
+        return record
+
 class GLPIGUIApp(tk.Tk):
     def __init__(self):
         super().__init__()
         self.config_manager = ConfigManager()
         self.username = None
         self.current_frame = None
+        self._frames = {}
+        self._log_listener = None
+        self._log_queue_handler = None
+        # Shared workers for login, search and add requests, so a click never has to spawn a thread;
+        # daemon workers, so closing the window does not wait for a request in flight
+        self.executor = glpi.DaemonExecutor(max_workers=4, thread_name_prefix="glpi-io")
 
         # CRITICAL: Setup logging FIRST before anything else
         self.setup_logging()
@@ -1376,7 +1619,8 @@ class GLPIGUIApp(tk.Tk):
         try:
             app_token = self.config_manager.config["glpi"]["app_token"]
             api_endpoint = self.config_manager.config["glpi"]["api_endpoint"]
-            glpi.init_glpi(app_token, api_endpoint)
+            verify_ssl = self.config_manager.config["glpi"]["verify_ssl"]
+            glpi.init_glpi(app_token, api_endpoint, verify_ssl)
         except (ValueError, KeyError) as e:
             logging.critical(f"CRITICAL ERROR: {e}")
             messagebox.showerror("Configuration Error", str(e))
@@ -1414,13 +1658,15 @@ class GLPIGUIApp(tk.Tk):
         
         # Create formatters
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = []
         
         # File handler
         try:
-            file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
+            # Rotate at 5 MB, keeping three old files, so the log cannot grow without bound
+            file_handler = logging.handlers.RotatingFileHandler(log_file_path, maxBytes=5_000_000, backupCount=3, encoding='utf-8')
             file_handler.setLevel(level)
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except Exception as e:
             print(f"Warning: Could not create log file {log_file_path}: {e}")
         
@@ -1428,7 +1674,14 @@ class GLPIGUIApp(tk.Tk):
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+        
+        # Callers only enqueue records; formatting and file/console I/O happen on the listener thread
+        log_queue = queue.SimpleQueue()
+        self._log_queue_handler = _DeferredQueueHandler(log_queue)
+        root_logger.addHandler(self._log_queue_handler)
+        self._log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._log_listener.start()
         
         # Set the root logger level
         root_logger.setLevel(level)
@@ -1438,10 +1691,19 @@ class GLPIGUIApp(tk.Tk):
         logging.info(f"Log file location: {log_file_path}")
 
     def switch_frame(self, frame_class):
-        if self.current_frame:
-            self.current_frame.destroy()
-        self.current_frame = frame_class(self.container, self)
-        self.current_frame.pack(fill="both", expand=True)
+        # Frames are built once and kept; showing one again only resets its state
+        frame = self._frames.get(frame_class)
+        if frame is None:
+            frame = self._frames[frame_class] = frame_class(self.container, self)
+        else:
+            frame.on_show()
+        if self.current_frame is not None and self.current_frame is not frame:
+            on_hide = getattr(self.current_frame, "on_hide", None)
+            if on_hide is not None:
+                on_hide()
+            self.current_frame.pack_forget()
+        self.current_frame = frame
+        frame.pack(fill="both", expand=True)
         logging.debug(f"Switched to frame: {frame_class.__name__}")
 
     def check_session_and_start(self):
@@ -1475,7 +1737,7 @@ class GLPIGUIApp(tk.Tk):
             except Exception as e:
                 self.after(0, self._handle_auth_error, str(e), status_label)
 
-        threading.Thread(target=_authenticate, daemon=True).start()
+        self.executor.submit(_authenticate)
 
     def _handle_auth_result(self, result, username, remember, status_label):
             self.config(cursor="")
@@ -1511,6 +1773,19 @@ class GLPIGUIApp(tk.Tk):
 
     def cleanup(self):
         self.cleanup_session()
+        glpi.close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        # Flush queued log records; cleanup runs from both on_closing and atexit
+        if self._log_listener:
+            logging.info("GLPI requests retried: %(retries)s, rate limited: %(rate_limited)s", glpi.metrics)
+            # Log directly from here on, so records from the exit path are not left in the queue
+            root_logger = logging.getLogger()
+            for handler in self._log_listener.handlers:
+                root_logger.addHandler(handler)
+            root_logger.removeHandler(self._log_queue_handler)
+            self._log_listener.stop()
+            self._log_listener = None
+            self._log_queue_handler = None
 
     def on_closing(self):
         self.cleanup()
@@ -7,7 +7,7 @@ setup(
     py_modules=["gui", "glpi", "system_info"], # Explicitly list individual .py files at the root
     install_requires=[
         "toml",
-        "requests",
+        "requests>=2.32",
         "psutil",
         "Pillow",
         "wmi; sys_platform == 'win32'",
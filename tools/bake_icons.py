@@ -0,0 +1,38 @@
+"""Pre-render the eye icons used by the password field.
+
+The GUI shows the icons at 24x24 in white. Baking them here means the client
+only has to load the PNGs instead of resizing and tinting the 512px sources on
+every start. Run again whenever assets/eye_open.png or eye_closed.png change:
+
+    python tools/bake_icons.py
+"""
+import os
+
+from PIL import Image
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+SIZE = (24, 24)
+COLOR = "#ffffff"
+
+
+def tint_image(image, color):
+    if image.mode != 'RGBA':
+        image = image.convert('RGBA')
+    color_layer = Image.new('RGBA', image.size, color)
+    alpha_mask = image.split()[-1]
+    tinted_image = Image.new('RGBA', image.size)
+    tinted_image.paste(color_layer, (0, 0), mask=alpha_mask)
+    return tinted_image
+
+
+def bake(name):
+    source = os.path.join(ASSETS_DIR, f"{name}.png")
+    target = os.path.join(ASSETS_DIR, f"{name}_white.png")
+    image = Image.open(source).resize(SIZE, Image.Resampling.LANCZOS)
+    tint_image(image, COLOR).save(target, optimize=True)
+    print(f"Wrote {target}")
+
+
+if __name__ == "__main__":
+    for name in ("eye_open", "eye_closed"):
+        bake(name)